@@ -1,5 +1,6 @@
 # Suppress TensorFlow warnings
 import os
+import sys
 # os.environ['TF_CPP_MIN_LOG_LEVEL'] = '3'  # Suppress all TensorFlow logging
 
 import h5py
@@ -7,15 +8,32 @@ import numpy as np
 import json
 import requests
 from pathlib import Path
-from typing import Dict, List, Tuple, Any
-import tensorflow as tf
+from typing import Dict, List, Tuple, Any, Optional, BinaryIO
 import subprocess
+import zipfile
+from hashlib import blake2b
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pysui import SuiConfig, SyncClient
 from pysui.sui.sui_builders.exec_builders import ExecuteTransaction
 from pysui.sui.sui_types.address import SuiAddress
 
-def print_banner(text: str) -> None:
-    """Display ASCII art banner with gradient colors."""
+# Largest vector literal emitted in model.move; bigger weight vectors are split
+MOVE_VECTOR_CHUNK = 65_536
+
+# Largest SCALE for which 10**SCALE is still a finite float64
+MAX_FLOAT_SCALE = 308
+
+# `sui move build` output, keyed on a hash of the weights it was built from
+BUILD_CACHE_PATH = './with_git_dependencies/build/weights_build_cache.json'
+
+# Weights extracted from the H5 model, keyed on the model file's mtime and size
+WEIGHTS_CACHE_PATH = './with_git_dependencies/build/weights_cache.npz'
+WEIGHTS_CACHE_META_PATH = './with_git_dependencies/build/weights_cache.json'
+
+@lru_cache(maxsize=1)
+def _render_banner(text: str) -> str:
+    """Build the ASCII art banner with gradient colors."""
     letters = {
         "O": [" ███ ", "█   █", "█   █", "█   █", " ███ "],
         "P": ["████ ", "█   █", "████ ", "█    ", "█    "],
@@ -27,7 +45,7 @@ def print_banner(text: str) -> None:
         "H": ["█   █", "█   █", "█████", "█   █", "█   █"]
     }
     
-    output = ["", "", "", "", ""]
+    output = [[], [], [], [], []]
     colors = [
         "\033[38;5;51m",  # Cyan
         "\033[38;5;45m",  # Light Blue
@@ -40,12 +58,16 @@ def print_banner(text: str) -> None:
     for char in text:
         if char in letters:
             for i, line in enumerate(letters[char]):
-                output[i] += f"{colors[i]}{line}{reset}   "
+                output[i].append(f"{colors[i]}{line}{reset}   ")
         elif char == " ":
             for i in range(5):
-                output[i] += "  "
+                output[i].append("  ")
 
-    print("\n" + "\n".join(output) + "\n\n")
+    return "\n" + "\n".join("".join(row) for row in output) + "\n\n\n"
+
+def print_banner(text: str) -> None:
+    """Display ASCII art banner with gradient colors."""
+    sys.stdout.write(_render_banner(text))
 
 def load_config() -> Dict[str, Any]:
     """Load configuration from config.txt file."""
@@ -67,35 +89,36 @@ def float_to_fixed(x: float, scale: int) -> Tuple[int, int]:
     abs_val = round(x * factor)
     return sign_bit, abs_val
 
-def load_h5_model(model_path: str) -> List[Dict]:
-    """Step 1: Load and process H5 model weights."""
-    print("\n1. Loading H5 model from:", model_path)
-    
-    try:
-        # Custom object scope to handle the reduction error
-        custom_objects = {
-            'reduction': 'sum_over_batch_size'  # Set default reduction method
-        }
-        
-        # Load model with custom objects
-        model = tf.keras.models.load_model(
-            model_path,
-            custom_objects=custom_objects,
-            compile=False  # Skip compilation to avoid metric/loss issues
-        )
-        
+def _decode(name: Any) -> str:
+    """h5py returns attribute strings as bytes or str depending on the writer."""
+    return name.decode('utf-8') if isinstance(name, bytes) else str(name)
+
+def _weight_kind(name: str) -> str:
+    """'dense/kernel:0' (Keras 2) and 'sequential/dense/kernel' (Keras 3) -> 'kernel'."""
+    return name.rsplit('/', 1)[-1].split(':')[0]
+
+def read_h5_weights(model_path: str) -> List[Dict]:
+    """Read Dense kernel/bias datasets straight from a Keras H5 file with h5py."""
+    with h5py.File(model_path, 'r') as f:
+        # Full-model saves nest weights under model_weights; save_weights() does not
+        root = f['model_weights'] if 'model_weights' in f else f
+
         converted_weights = []
-        for layer in model.layers:
-            if not layer.weights:  # Skip layers without weights
+        # layer_names preserves the model's layer order
+        for layer_name in map(_decode, root.attrs['layer_names']):
+            group = root[layer_name]
+            weight_names = [_decode(n) for n in group.attrs.get('weight_names', [])]
+            if len(weight_names) != 2:  # Skip layers without kernel and bias
                 continue
-                
-            weights = layer.get_weights()
-            if len(weights) != 2:  # Skip layers without kernel and bias
+
+            kernel_name, bias_name = weight_names
+            if (_weight_kind(kernel_name), _weight_kind(bias_name)) != ('kernel', 'bias'):
                 continue
-                
-            kernel, bias = weights
+
+            kernel = group[kernel_name][()]
+            bias = group[bias_name][()]
             converted_weights.append({
-                "layerName": layer.name,
+                "layerName": layer_name,
                 "kernel": {
                     "shape": list(kernel.shape),
                     "data": kernel
@@ -105,117 +128,271 @@ def load_h5_model(model_path: str) -> List[Dict]:
                     "data": bias
                 }
             })
-        
-        print(f"Successfully loaded model with {len(converted_weights)} layers")
+
+    if not converted_weights:
+        raise ValueError("No Dense kernel/bias layers found in layer_names")
+    return converted_weights
+
+def read_keras_weights(model_path: str) -> List[Dict]:
+    """Read layer weights by rebuilding the model with tf.keras."""
+    import tensorflow as tf  # Deferred: only needed for non-H5 model formats
+
+    # Custom object scope to handle the reduction error
+    custom_objects = {
+        'reduction': 'sum_over_batch_size'  # Set default reduction method
+    }
+    
+    # Load model with custom objects
+    model = tf.keras.models.load_model(
+        model_path,
+        custom_objects=custom_objects,
+        compile=False  # Skip compilation to avoid metric/loss issues
+    )
+    
+    converted_weights = []
+    for layer in model.layers:
+        # Filter on the variables themselves so skipped layers are never copied
+        if len(layer.weights) != 2:  # Skip layers without kernel and bias
+            continue
+        if getattr(layer, 'kernel', None) is None or getattr(layer, 'bias', None) is None:
+            continue
+            
+        kernel = np.ascontiguousarray(layer.kernel.numpy(), dtype=np.float32)
+        bias = np.ascontiguousarray(layer.bias.numpy(), dtype=np.float32)
+        converted_weights.append({
+            "layerName": layer.name,
+            "kernel": {
+                "shape": list(kernel.shape),
+                "data": kernel
+            },
+            "bias": {
+                "shape": list(bias.shape),
+                "data": bias
+            }
+        })
+    
+    return converted_weights
+
+def weights_cache_key(model_path: str) -> str:
+    """Identify a model file revision, and the extractor code, without reading the model."""
+    # Extractor changes invalidate the cache, as in weights_digest
+    extractor = blake2b(Path(__file__).read_bytes(), digest_size=16).hexdigest()
+    return f"{os.path.abspath(model_path)}_{os.path.getmtime(model_path)}_{os.path.getsize(model_path)}_{extractor}"
+
+def load_cached_weights(model_path: str) -> Optional[List[Dict]]:
+    """Return weights saved by save_cached_weights if the model file is unchanged."""
+    try:
+        with open(WEIGHTS_CACHE_META_PATH, 'r') as f:
+            meta = json.load(f)
+        if meta.get('key') != weights_cache_key(model_path) or not meta.get('layers'):
+            return None
+
+        converted_weights = []
+        with np.load(WEIGHTS_CACHE_PATH) as data:
+            for i, layer_name in enumerate(meta['layers']):
+                kernel = data[f'{i}_k']
+                bias = data[f'{i}_b']
+                converted_weights.append({
+                    "layerName": layer_name,
+                    "kernel": {
+                        "shape": list(kernel.shape),
+                        "data": kernel
+                    },
+                    "bias": {
+                        "shape": list(bias.shape),
+                        "data": bias
+                    }
+                })
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+        return None
+
+    print(f"\n1. Model unchanged, loaded {len(converted_weights)} layers from {WEIGHTS_CACHE_PATH}")
+    return converted_weights
+
+def save_cached_weights(model_path: str, weights: List[Dict]) -> None:
+    """Save extracted weights as .npz with a sidecar keyed on the model file."""
+    if not weights:  # Never cache a failed extraction
+        return
+    os.makedirs(os.path.dirname(WEIGHTS_CACHE_PATH), exist_ok=True)
+    if os.path.exists(WEIGHTS_CACHE_META_PATH):
+        os.remove(WEIGHTS_CACHE_META_PATH)
+
+    arrays = {}
+    for i, layer in enumerate(weights):
+        arrays[f'{i}_k'] = layer["kernel"]["data"]
+        arrays[f'{i}_b'] = layer["bias"]["data"]
+    np.savez(WEIGHTS_CACHE_PATH, **arrays)
+
+    # The sidecar is written last so a partial save is never treated as a hit
+    with open(WEIGHTS_CACHE_META_PATH, 'w') as f:
+        json.dump({
+            'key': weights_cache_key(model_path),
+            'layers': [layer["layerName"] for layer in weights]
+        }, f)
+
+def load_h5_model(model_path: str) -> List[Dict]:
+    """Step 1: Load and process H5 model weights."""
+    print("\n1. Loading H5 model from:", model_path)
+    
+    try:
+        converted_weights = read_h5_weights(model_path)
+        print(f"Successfully loaded model with {len(converted_weights)} layers using h5py")
         return converted_weights
         
     except Exception as e:
-        print(f"Error loading model: {str(e)}")
-        # Alternative loading method using h5py directly
+        print(f"Error loading model with h5py: {str(e)}")
+        # Fall back to TensorFlow for formats h5py cannot read (e.g. SavedModel)
         try:
-            print("Attempting to load weights directly using h5py...")
-            with h5py.File(model_path, 'r') as f:
-                converted_weights = []
-                # Iterate through model layers
-                for layer_name in f.keys():
-                    if 'dense' in layer_name:
-                        weights = f[layer_name]['dense']['kernel:0'][()]
-                        bias = f[layer_name]['dense']['bias:0'][()]
-                        
-                        converted_weights.append({
-                            "layerName": layer_name,
-                            "kernel": {
-                                "shape": list(weights.shape),
-                                "data": weights
-                            },
-                            "bias": {
-                                "shape": list(bias.shape),
-                                "data": bias
-                            }
-                        })
-                
-                print(f"Successfully loaded model with {len(converted_weights)} layers using h5py")
-                return converted_weights
-                
+            print("Attempting to load model using TensorFlow...")
+            converted_weights = read_keras_weights(model_path)
+            print(f"Successfully loaded model with {len(converted_weights)} layers")
+            return converted_weights
+            
         except Exception as e2:
-            print(f"Error loading model with h5py: {str(e2)}")
+            print(f"Error loading model: {str(e2)}")
             raise Exception("Failed to load model using both methods") from e2
 
+def array_to_fixed(data: np.ndarray, factor: np.float64) -> Tuple[np.ndarray, np.ndarray]:
+    """Convert a whole float array to fixed point (sign, magnitude) arrays."""
+    values = np.asarray(data, dtype=np.float64).ravel()
+    signs = np.signbit(values).view(np.uint8)  # reads the IEEE sign bit, no compare
+    # Scale and round in place on the float64 copy returned by np.abs
+    scaled = np.abs(values)
+    np.multiply(scaled, factor, out=scaled)
+    np.rint(scaled, out=scaled)
+
+    # Keep magnitudes in the narrowest unsigned buffer that holds this layer
+    # (uint8/16/32/64); check_u64_range has already ruled out overflow
+    peak = scaled.max() if scaled.size else 0.0
+    mags = scaled.astype(np.min_scalar_type(int(peak)))
+    return signs, mags
+
+def fits_u64(peak: float, scale: int) -> bool:
+    """Whether |peak| quantized at scale still fits a Move u64."""
+    if scale > MAX_FLOAT_SCALE:  # 10**scale is not a float64, so nothing can be quantized
+        return False
+    with np.errstate(over='ignore'):
+        return np.rint(np.float64(peak) * np.float64(10 ** scale)) < 2.0 ** 64
+
+def check_u64_range(weights: List[Dict], scale: int) -> None:
+    """Reject a scale whose magnitudes would overflow a Move u64, before quantizing."""
+    # One reduction per array instead of discovering the overflow downstream
+    peak = 0.0
+    for layer in weights:
+        for data in (layer["kernel"]["data"], layer["bias"]["data"]):
+            if not np.size(data):
+                continue
+            # np.abs(...).max() propagates NaN, unlike Python's max()
+            array_peak = float(np.abs(data).max())
+            if not np.isfinite(array_peak):
+                raise ValueError(f"Layer {layer['layerName']} contains NaN or infinite weights")
+            peak = max(peak, array_peak)
+
+    if fits_u64(peak, scale):
+        return
+
+    # Work in log space so neither 10**scale nor 2**64 / peak can overflow
+    if peak == 0.0:
+        max_scale = MAX_FLOAT_SCALE
+    else:
+        max_scale = min(MAX_FLOAT_SCALE, int(np.floor(64 * np.log10(2.0) - np.log10(peak))))
+    while max_scale > 0 and not fits_u64(peak, max_scale):
+        max_scale -= 1
+    raise ValueError(
+        f"SCALE={scale} overflows Move u64 magnitudes (largest |weight| is {peak}); "
+        f"use SCALE={max_scale} or lower"
+    )
+
+def quantize_layer(layer: Dict, scale: int, factor: np.float64) -> Dict:
+    """Convert one layer's kernel and bias to fixed-point representation."""
+    kernel_signs, kernel_mags = array_to_fixed(layer["kernel"]["data"], factor)
+    bias_signs, bias_mags = array_to_fixed(layer["bias"]["data"], factor)
+        
+    return {
+        "layerName": layer["layerName"],
+        "kernel": {
+            "magnitude": kernel_mags,
+            "sign": kernel_signs,
+            "shape": layer["kernel"]["shape"]
+        },
+        "bias": {
+            "magnitude": bias_mags,
+            "sign": bias_signs,
+            "shape": layer["bias"]["shape"]
+        },
+        "scale": scale
+    }
+
 def convert_weights_to_fixed(weights: List[Dict], scale: int) -> List[Dict]:
     """Convert weights to fixed-point representation."""
-    converted = []
-    
-    for layer in weights:
-        kernel_signs = []
-        kernel_mags = []
-        for val in layer["kernel"]["data"].flatten():
-            sign, mag = float_to_fixed(float(val), scale)
-            kernel_signs.append(sign)
-            kernel_mags.append(mag)
-            
-        bias_signs = []
-        bias_mags = []
-        for val in layer["bias"]["data"].flatten():
-            sign, mag = float_to_fixed(float(val), scale)
-            bias_signs.append(sign)
-            bias_mags.append(mag)
-            
-        converted.append({
-            "layerName": layer["layerName"],
-            "kernel": {
-                "magnitude": kernel_mags,
-                "sign": kernel_signs,
-                "shape": layer["kernel"]["shape"]
-            },
-            "bias": {
-                "magnitude": bias_mags,
-                "sign": bias_signs,
-                "shape": layer["bias"]["shape"]
-            },
-            "scale": scale
-        })
+    # scale is a decimal exponent: tensorflowsui's tensor::scale_up multiplies by
+    # 10 per step and the JS input encoders use 10**scale, so it must stay base 10
+    check_u64_range(weights, scale)
+    factor = np.float64(10 ** scale)  # shared by every layer
     
-    return converted
+    # NumPy releases the GIL inside abs/rint/astype, so layers run in parallel;
+    # map() keeps the original layer order
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        return list(executor.map(lambda layer: quantize_layer(layer, scale, factor), weights))
 
-def generate_move_code(converted_weights: List[Dict], scale: int) -> str:
-    """Generate Move smart contract code."""
-    move_code = f"""module models::model {{
+def format_vector(values: np.ndarray) -> bytes:
+    """Format an integer array as an encoded Move vector literal."""
+    # tolist() converts to Python ints in one C pass, which keeps str() cheap
+    return f"vector[{', '.join(map(str, np.asarray(values).tolist()))}]".encode('ascii')
+
+def write_move_header(f: BinaryIO) -> None:
+    """Write the Move module header and open create_model_signed_fixed."""
+    f.write(b"""module models::model {
     use sui::tx_context::TxContext;
     use tensorflowsui::graph;
     use tensorflowsui::tensor;
 
-    public fun create_model_signed_fixed(graph: &mut graph::SignedFixedGraph, scale: u64) {{
-"""
-    
-    # Add layer declarations
-    for layer in converted_weights:
-        input_size, output_size = layer["kernel"]["shape"]
-        move_code += f'        graph::DenseSignedFixed(graph, {input_size}, {output_size}, b"{layer["layerName"]}", scale);\n'
-    
-    # Add weights for each layer
-    for layer in converted_weights:
-        kernel_mag = f"vector[{', '.join(map(str, layer['kernel']['magnitude']))}]"
-        kernel_sign = f"vector[{', '.join(map(str, layer['kernel']['sign']))}]"
-        bias_mag = f"vector[{', '.join(map(str, layer['bias']['magnitude']))}]"
-        bias_sign = f"vector[{', '.join(map(str, layer['bias']['sign']))}]"
-        
-        move_code += f"""
-        let w{layer['layerName']}_mag = {kernel_mag};
-        let w{layer['layerName']}_sign = {kernel_sign};
-        let b{layer['layerName']}_mag = {bias_mag};
-        let b{layer['layerName']}_sign = {bias_sign};
+    public fun create_model_signed_fixed(graph: &mut graph::SignedFixedGraph, scale: u64) {
+""")
+
+def write_layer_decl(f: BinaryIO, layer: Dict) -> None:
+    """Write the DenseSignedFixed declaration for a layer."""
+    input_size, output_size = layer["kernel"]["shape"]
+    f.write(f'        graph::DenseSignedFixed(graph, {input_size}, {output_size}, b"{layer["layerName"]}", scale);\n'.encode('utf-8'))
+
+def write_vector_binding(f: BinaryIO, var: str, values: np.ndarray) -> None:
+    """Write `let var = vector[...]`, split into appended chunks when large."""
+    if len(values) <= MOVE_VECTOR_CHUNK:
+        f.write(f"\n        let {var} = ".encode('utf-8'))
+        f.write(format_vector(values))
+        f.write(b";")
+        return
+
+    # Each chunk is its own literal; vector::append rebuilds the full vector
+    f.write(f"\n        let mut {var} = ".encode('utf-8'))
+    f.write(format_vector(values[:MOVE_VECTOR_CHUNK]))
+    f.write(b";")
+    for start in range(MOVE_VECTOR_CHUNK, len(values), MOVE_VECTOR_CHUNK):
+        f.write(f"\n        vector::append(&mut {var}, ".encode('utf-8'))
+        f.write(format_vector(values[start:start + MOVE_VECTOR_CHUNK]))
+        f.write(b");")
+
+def write_layer_weights(f: BinaryIO, layer: Dict) -> None:
+    """Write the weight vectors and set_layer_weights_signed_fixed call for a layer."""
+    name = layer['layerName']
+    write_vector_binding(f, f"w{name}_mag", layer['kernel']['magnitude'])
+    write_vector_binding(f, f"w{name}_sign", layer['kernel']['sign'])
+    write_vector_binding(f, f"b{name}_mag", layer['bias']['magnitude'])
+    write_vector_binding(f, f"b{name}_sign", layer['bias']['sign'])
+    f.write(f"""
 
         graph::set_layer_weights_signed_fixed(
             graph,
-            b"{layer['layerName']}",
-            w{layer['layerName']}_mag, w{layer['layerName']}_sign,
-            b{layer['layerName']}_mag, b{layer['layerName']}_sign,
+            b"{name}",
+            w{name}_mag, w{name}_sign,
+            b{name}_mag, b{name}_sign,
             {layer['kernel']['shape'][0]}, {layer['kernel']['shape'][1]},
             scale
-        );"""
-    
-    # Add helper functions
-    move_code += """
+        );""".encode('utf-8'))
+
+def write_move_trailer(f: BinaryIO) -> None:
+    """Close create_model_signed_fixed and write the entry functions."""
+    f.write(b"""
     }
 
     entry public fun split_chunk_compute(
@@ -281,9 +458,22 @@ def generate_move_code(converted_weights: List[Dict], scale: int) -> str:
         graph::share_graph(graph);
         graph::share_partial(partials);
     }
-}}"""
+}}""")
+
+def write_move_code(f: BinaryIO, converted_weights: List[Dict], scale: int) -> None:
+    """Generate Move smart contract code, writing it to f as it is produced."""
+    write_move_header(f)
     
-    return move_code
+    # Add layer declarations
+    for layer in converted_weights:
+        write_layer_decl(f, layer)
+    
+    # Add weights for each layer
+    for layer in converted_weights:
+        write_layer_weights(f, layer)
+    
+    # Add helper functions
+    write_move_trailer(f)
 
 def generate_move_toml(config: Dict[str, Any]) -> str:
     """Generate Move.toml file content."""
@@ -316,13 +506,61 @@ def generate_move_files(converted_weights: List[Dict], scale: int, config: Dict[
         f.write(move_toml)
     print("Move.toml generated and saved")
     
-    # Generate and save model.move
-    move_code = generate_move_code(converted_weights, scale)
-    with open('./with_git_dependencies/sources/model.move', 'w') as f:
-        f.write(move_code)
+    # Generate and save model.move, streaming it straight to disk
+    # Binary mode skips the text codec; every fragment is already encoded
+    with open('./with_git_dependencies/sources/model.move', 'wb', buffering=8 << 20) as f:
+        write_move_code(f, converted_weights, scale)
     print("model.move generated and saved")
 
-def publish_to_network(config: Dict[str, Any]) -> Tuple[str, str]:
+def weights_digest(converted_weights: List[Dict], scale: int, config: Dict[str, Any]) -> str:
+    """Hash everything that goes into the Move package build."""
+    h = blake2b(digest_size=16)
+    h.update(Path(__file__).read_bytes())  # generator changes invalidate the cache
+    h.update(generate_move_toml(config).encode())
+    h.update(str(scale).encode())
+    for layer in converted_weights:
+        h.update(layer["layerName"].encode())
+        h.update(str(layer["kernel"]["shape"]).encode())
+        for values in (layer["kernel"]["magnitude"], layer["kernel"]["sign"],
+                       layer["bias"]["magnitude"], layer["bias"]["sign"]):
+            h.update(values.dtype.str.encode())
+            h.update(np.ascontiguousarray(values).tobytes())
+    return h.hexdigest()
+
+def load_cached_build(weights_hash: str) -> Optional[Dict[str, Any]]:
+    """Return the cached `sui move build` output if it was built from weights_hash."""
+    try:
+        with open(BUILD_CACHE_PATH, 'r') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cache.get('weightsHash') != weights_hash:
+        return None
+    return cache['build']
+
+def save_cached_build(weights_hash: str, build_data: Dict[str, Any]) -> None:
+    """Store the `sui move build` output next to the build directory."""
+    os.makedirs(os.path.dirname(BUILD_CACHE_PATH), exist_ok=True)
+    with open(BUILD_CACHE_PATH, 'w') as f:
+        json.dump({'weightsHash': weights_hash, 'build': build_data}, f)
+
+def build_move_package() -> Dict[str, Any]:
+    """Build the Move package and return its base64 bytecode dump."""
+    try:
+        build_output = subprocess.check_output(
+            "sui move build --dump-bytecode-as-base64 --path ./with_git_dependencies --silence-warnings",
+            shell=True,
+            text=True
+        )
+        build_data = json.loads(build_output)
+        print("Build successful!")
+        return build_data
+        
+    except Exception as e:
+        print("Error building Move package:", e)
+        raise
+
+def publish_to_network(config: Dict[str, Any], build_data: Dict[str, Any]) -> Tuple[str, str]:
     """Step 4: Publish to SUI network using pysui."""
     print("\n3. Publishing to " + config['NETWORK'] + "...")
     
@@ -335,16 +573,7 @@ def publish_to_network(config: Dict[str, Any]) -> Tuple[str, str]:
     # Create sync client
     client = SyncClient(sui_config)
     
-    # Build the Move package
     try:
-        build_output = subprocess.check_output(
-            "sui move build --dump-bytecode-as-base64 --path ./with_git_dependencies --silence-warnings",
-            shell=True,
-            text=True
-        )
-        build_data = json.loads(build_output)
-        print("Build successful!")
-        
         # Create execute transaction builder
         execute_txn = ExecuteTransaction(
             client=client,
@@ -425,15 +654,25 @@ def main():
     model_path = config["H5_MODEL_PATH"]
     scale = int(config["SCALE"])
     
-    # Step 1: Load and process H5 model
-    weights = load_h5_model(model_path)
+    # Step 1: Load and process H5 model, reusing weights extracted on a previous run
+    weights = load_cached_weights(model_path)
+    if weights is None:
+        weights = load_h5_model(model_path)
+        save_cached_weights(model_path, weights)
     converted_weights = convert_weights_to_fixed(weights, scale)
     
-    # Step 2 & 3: Generate Move files
-    generate_move_files(converted_weights, scale, config)
+    # Step 2 & 3: Generate and build Move files, unless this model is already built
+    weights_hash = weights_digest(converted_weights, scale, config)
+    build_data = load_cached_build(weights_hash)
+    if build_data is None:
+        generate_move_files(converted_weights, scale, config)
+        build_data = build_move_package()
+        save_cached_build(weights_hash, build_data)
+    else:
+        print("\n2. Model unchanged, reusing cached Move build")
     
     # Step 4: Publish to network
-    package_id, digest = publish_to_network(config)
+    package_id, digest = publish_to_network(config, build_data)
     
     # Store training data
     blob_id = store_train_data(package_id, digest, config)